@@ -1,20 +1,45 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import JSONResponse
+from limits import parse
+from pydantic import BaseModel, ConfigDict, Field
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+import asyncio
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+from typing import Annotated, List, Literal, Optional
 import re
+import threading
 
 import language_tool_python
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Start LanguageTool in the background so the server is ready without
+    # waiting on the JVM
+    start_language_tool_warmup(app)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 # ---------- CORS ----------
-origins = [
+# A frozenset makes CORSMiddleware's per-request origin check a hash lookup.
+origins = frozenset({
     "http://localhost:5173",
     "http://127.0.0.1:5173",
     "http://localhost:8080",
     "http://127.0.0.1:8080",
-]
+})
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,8 +47,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# ---------- Rate Limiting ----------
+# Per-client limits shed bursts before they queue up on LanguageTool.
+# Counters live in each worker's memory; point RATE_LIMIT_STORAGE at Redis
+# (redis://..., needs the redis package) to share them between workers.
+CORRECT_RATE_LIMIT = os.getenv("CORRECT_RATE_LIMIT", "120/minute")
+POLISH_RATE_LIMIT = os.getenv("POLISH_RATE_LIMIT", "60/minute")
+# /correct and /correct/bulk share one budget of corrections per client;
+# a bulk request is charged once per text it carries.
+CORRECT_LIMIT_SCOPE = "correct"
+CORRECT_LIMIT = parse(CORRECT_RATE_LIMIT)
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=os.getenv("RATE_LIMIT_STORAGE", "memory://"),
+)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+
+def hit_correct_limit(request: Request, cost: int) -> bool:
+    """
+    Charge cost corrections to the client's /correct budget.
+    Returns False once the budget is used up.
+    """
+    if not limiter.enabled:
+        return True
+    return limiter.limiter.hit(
+        CORRECT_LIMIT,
+        get_remote_address(request),
+        CORRECT_LIMIT_SCOPE,
+        cost=cost,
+    )
+
+
 # ---------- Root ----------
 @app.get("/")
 def read_root():
@@ -31,137 +91,331 @@ def read_root():
 
 
 # ---------- Grammar Tool ----------
-tool = language_tool_python.LanguageTool("en-US")
+# Creating LanguageTool starts a local JVM (and downloads it on first run),
+# so it is built lazily instead of at import time.
+_tool = None
+_tool_lock = threading.Lock()
+
+# Dedicated threads for LanguageTool so grammar checks don't compete with
+# the default executor and the number of checks in flight stays bounded.
+# Concurrent requests fan out over these workers against the one LanguageTool
+# server; raise LT_MAX_WORKERS on hosts with more cores.
+LT_MAX_WORKERS = int(os.getenv("LT_MAX_WORKERS", "4"))
+LT_POOL = ThreadPoolExecutor(max_workers=LT_MAX_WORKERS, thread_name_prefix="languagetool")
+
+# Set LT_REMOTE_SERVER (e.g. http://languagetool:8010) to use an already warm,
+# self-hosted LanguageTool instead of starting a JVM in every worker.
+LT_REMOTE_SERVER = os.getenv("LT_REMOTE_SERVER")
+
+# Options for the locally started server: keep its result cache on and let it
+# check as many texts in parallel as we send.
+LT_SERVER_CONFIG = {
+    "cacheSize": int(os.getenv("LT_CACHE_SIZE", "1000")),
+    "pipelineCaching": True,
+    "maxCheckThreads": LT_MAX_WORKERS,
+}
+
+
+def get_language_tool():
+    global _tool
+    if _tool is None:
+        with _tool_lock:
+            if _tool is None:
+                if LT_REMOTE_SERVER:
+                    _tool = language_tool_python.LanguageTool(
+                        "en-US", remote_server=LT_REMOTE_SERVER
+                    )
+                else:
+                    _tool = language_tool_python.LanguageTool(
+                        "en-US", config=LT_SERVER_CONFIG
+                    )
+    return _tool
+
+
+def warm_up_language_tool():
+    # The first check after start loads rule data, so pay for it here
+    # instead of on the first user request.
+    get_language_tool().check("Hello world.")
+
+
+def _log_warmup_failure(future):
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("LanguageTool warm-up failed", exc_info=exc)
+
+
+def start_language_tool_warmup(app: FastAPI):
+    loop = asyncio.get_running_loop()
+    app.state.tool_warmup = loop.run_in_executor(LT_POOL, warm_up_language_tool)
+    # Read the result so a JVM start failure is logged, not left unretrieved
+    app.state.tool_warmup.add_done_callback(_log_warmup_failure)
+
+
+# ---------- Request Coalescing ----------
+# Identical requests that arrive while one is still running share its result.
+_inflight = {}
+
+
+async def run_coalesced(func, *args):
+    """
+    Run a blocking grammar call func(*args) on the LanguageTool pool.
+    Concurrent calls with the same arguments await the same task
+    instead of repeating the work.
+    """
+    key = (func, args)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.get_running_loop().run_in_executor(LT_POOL, func, *args)
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one client disconnecting must not cancel the others' work
+    return await asyncio.shield(task)
 
 
 # ---------- Request Models ----------
 
-class TextRequest(BaseModel):
-    text: str
-    mode: Optional[str] = "grammar"  # "grammar" | "professional" | "casual"
+class RequestModel(BaseModel):
+    # Strip surrounding whitespace while validating, so handlers don't have to
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+# Longer inputs are rejected with a 422 before any grammar work is done.
+MAX_TEXT_LENGTH = 10_000
 
+RequestText = Annotated[str, Field(max_length=MAX_TEXT_LENGTH)]
 
-class AIRequest(BaseModel):
-    text: str
+# "fluent" is sent by the frontend's "Make Fluent" button and corrects like "grammar"
+CorrectionMode = Literal["grammar", "professional", "casual", "fluent"]
 
+# Upper bound on texts per /correct/bulk request, to protect the worker.
+BULK_MAX_TEXTS = 100
 
-class ToneRequest(BaseModel):
-    text: str
-    tone: str  # "friendly" | "professional" | "confident" | "calm" | "caring" | "persuasive"
+
+class TextRequest(RequestModel):
+    text: RequestText
+    mode: CorrectionMode = "grammar"
+
+
+class BulkTextRequest(RequestModel):
+    texts: List[RequestText] = Field(max_length=BULK_MAX_TEXTS)
+    mode: CorrectionMode = "grammar"
+
+
+# Declared response models let FastAPI serialize straight to JSON with
+# pydantic-core instead of going through jsonable_encoder.
+class CorrectionResponse(BaseModel):
+    correctedText: str
+    changesSummary: str
+
+
+class BulkCorrectionResponse(BaseModel):
+    results: List[CorrectionResponse]
+
+
+class AIRequest(RequestModel):
+    text: RequestText
+
+
+class ToneRequest(RequestModel):
+    text: RequestText
+    tone: Literal["friendly", "professional", "confident", "calm", "caring", "persuasive"]
 
 
 # ---------- Helpers ----------
 
+# Only texts up to this length are cached, so a cache's memory is bounded by
+# its maxsize times this length rather than by whatever clients send.
+CACHE_MAX_TEXT_LENGTH = 1_000
+
+
+def text_cache(maxsize: int):
+    """
+    lru_cache for functions whose first argument is the text.
+    Texts longer than CACHE_MAX_TEXT_LENGTH bypass the cache.
+    """
+
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(text: str, *args):
+            if len(text) > CACHE_MAX_TEXT_LENGTH:
+                return func(text, *args)
+            return cached(text, *args)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
 def normalize_spaces(text: str) -> str:
+    # Already-clean text (the common case) is returned without a copy.
+    # Printable ASCII has no whitespace but " ", so these C-level checks are
+    # enough there; anything else ("\xa0", tabs, newlines) goes through split().
+    if (
+        text.isascii()
+        and text.isprintable()
+        and "  " not in text
+        and not text.startswith(" ")
+        and not text.endswith(" ")
+    ):
+        return text
     return " ".join(text.split())
 
 
-def split_sentences(text: str):
+_TERMINALS = (".", "!", "?")
+
+
+def finalize_text(text: str) -> str:
     """
-    Split text into sentences, keeping punctuation.
-    Very simple splitter, but enough for our use-case.
+    Capitalize the first letter and make sure the text ends with
+    sentence punctuation. Expects already-stripped text; nothing is
+    copied when it is already capitalized and punctuated.
     """
-    parts = re.split(r"([.!?])", text)
-    sentences = []
-    current = ""
-
-    for part in parts:
-        if not part:
-            continue
-        if part in ".!?":
-            current += part
-            sentences.append(current.strip())
-            current = ""
-        else:
-            current += part
+    if not text:
+        return text
+    if text[:1].islower():
+        text = text[:1].upper() + text[1:]
+    if not text.endswith(_TERMINALS):
+        text += "."
+    return text
 
-    if current.strip():
-        sentences.append(current.strip())
 
-    return sentences
+def compile_alternation(keys) -> "re.Pattern":
+    """
+    Build one regex matching any of the literal keys.
+    Longer keys come first so "I will try to" wins over "I will try".
+    """
+    ordered = sorted(keys, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered))
 
 
-def smart_rewrite_sentence(sentence: str) -> str:
+def compile_word_alternation(keys, flags: int = 0) -> "re.Pattern":
     """
-    Smart Rewrite v2:
-    - Softly improve flow
-    - Remove weak phrases
-    - Improve connectors
-    - Make subject-pronoun usage more natural
+    Like compile_alternation(), but keys only match as whole words, so
+    "ok" does not hit "okay". A key starting with a space keeps that space,
+    letting a filler word be removed together with it.
     """
+    ordered = sorted(keys, key=len, reverse=True)
+    return re.compile(
+        r"(?:%s)\b"
+        % "|".join(
+            re.escape(k) if k.startswith(" ") else r"\b" + re.escape(k)
+            for k in ordered
+        ),
+        flags,
+    )
 
-    s = sentence.strip()
 
-    # Basic: ensure single spaces
-    s = normalize_spaces(s)
+# A run of text up to and including one . ! or ?, or a trailing
+# fragment with no closing punctuation.
+_SENTENCE_RE = re.compile(r"[^.!?]*[.!?]|[^.!?]+")
 
+
+def split_sentences(text: str):
+    """
+    Split text into sentences, keeping punctuation.
+    Very simple splitter, but enough for our use-case.
+    """
+    return [
+        sentence
+        for sentence in (m.group(0).strip() for m in _SENTENCE_RE.finditer(text))
+        if sentence
+    ]
+
+
+# ---------- Smart Rewrite rules ----------
+
+WEAK_PHRASES = {
+    "I think that ": "",
+    "I think ": "",
+    "maybe ": "",
+    "probably ": "",
+    "kind of ": "",
+    "sort of ": "",
+    "a little bit ": "a bit ",
+}
+
+PHRASE_REPLACEMENTS = {
+    "I want to tell him that": "I wanted to let him know that",
+    "I want to tell her that": "I wanted to let her know that",
+    "I want to tell them that": "I wanted to let them know that",
+    "I want to tell you that": "I wanted to let you know that",
+    "I want to tell that": "I wanted to explain that",
+    "I want to explain him": "I wanted to explain to him",
+    "I want to explain her": "I wanted to explain to her",
+    "I want to explain them": "I wanted to explain to them",
+    "I will try to": "I will",
+    "I will try": "I will",
+    "very very": "very",
+}
+
+# "But later I..." -> "However, later I..."
+# "later I realized" -> "Later, I realised"
+CONNECTORS = {
+    "but": "However, ",
+    "and": "",
+    "so": "As a result, ",
+    "then": "Then, ",
+    "later": "Later, ",
+}
+
+_LOWER_I_RE = re.compile(r"\bi\b")
+_WEAK_RE = compile_alternation(WEAK_PHRASES)
+_PHRASE_RE = compile_alternation(PHRASE_REPLACEMENTS)
+
+
+def rewrite_phrases(text: str) -> str:
+    """
+    Phrase-level rules: lowercase "i", weak phrases and phrasing smoothing.
+    No rule spans sentence punctuation, so this can run once over a
+    whole paragraph instead of once per sentence.
+    """
     # Fix lowercase "i" to "I"
-    s = re.sub(r"\bi\b", "I", s)
+    text = _LOWER_I_RE.sub("I", text)
 
     # 1) Weak phrase cleanup
-    weak_map = {
-        "I think that ": "",
-        "I think ": "",
-        "maybe ": "",
-        "probably ": "",
-        "kind of ": "",
-        "sort of ": "",
-        "a little bit ": "a bit ",
-    }
-    for k, v in weak_map.items():
-        s = s.replace(k, v)
+    text = _WEAK_RE.sub(lambda m: WEAK_PHRASES[m.group(0)], text)
 
     # 2) Tense / phrasing smoothing
-    replacements = {
-        "I want to tell him that": "I wanted to let him know that",
-        "I want to tell her that": "I wanted to let her know that",
-        "I want to tell them that": "I wanted to let them know that",
-        "I want to tell you that": "I wanted to let you know that",
-        "I want to tell that": "I wanted to explain that",
-        "I want to explain him": "I wanted to explain to him",
-        "I want to explain her": "I wanted to explain to her",
-        "I want to explain them": "I wanted to explain to them",
-        "I will try to": "I will",
-        "I will try": "I will",
-        "very very": "very",
-    }
-    for k, v in replacements.items():
-        s = s.replace(k, v)
-
-    # 3) Start-of-sentence connectors
-    s_strip_lower = s.lower().lstrip()
+    return _PHRASE_RE.sub(lambda m: PHRASE_REPLACEMENTS[m.group(0)], text)
 
-    if s_strip_lower.startswith("but "):
-        # "But later I..." -> "However, later I..."
-        s = re.sub(r"^but\s+", "However, ", s, flags=re.IGNORECASE)
-    elif s_strip_lower.startswith("and "):
-        s = re.sub(r"^and\s+", "", s, flags=re.IGNORECASE)
-    elif s_strip_lower.startswith("so "):
-        s = re.sub(r"^so\s+", "As a result, ", s, flags=re.IGNORECASE)
-    elif s_strip_lower.startswith("then "):
-        s = re.sub(r"^then\s+", "Then, ", s, flags=re.IGNORECASE)
-    elif s_strip_lower.startswith("later "):
-        # "later I realized" -> "Later, I realised"
-        s = re.sub(r"^later\s+", "Later, ", s, flags=re.IGNORECASE)
 
-    return s
+def rewrite_connector(sentence: str) -> str:
+    """
+    3) Start-of-sentence connectors (only the first word is inspected).
+    Expects a space-normalized sentence.
+    """
+    head, sep, tail = sentence.partition(" ")
+    if sep:
+        connector = CONNECTORS.get(head.lower())
+        if connector is not None:
+            return connector + tail
+    return sentence
 
 
+@text_cache(maxsize=512)
 def smart_rewrite(text: str) -> str:
     """
     Smart Rewrite v2 over the whole paragraph.
-    1) Split into sentences
-    2) Improve each sentence
+    1) Apply phrase rules to the whole paragraph in one pass
+    2) Split into sentences and fix each sentence's connector
     3) Join them back with nice spacing
+
+    Results are cached, so repeated paragraphs skip the rewrite entirely.
     """
-    text = normalize_spaces(text)
+    text = rewrite_phrases(normalize_spaces(text))
     sentences = split_sentences(text)
 
     improved = []
     last = ""
 
     for sent in sentences:
-        new_s = smart_rewrite_sentence(sent)
+        new_s = rewrite_connector(sent)
 
         # Avoid exact duplicates back-to-back
         if new_s == last:
@@ -175,112 +429,223 @@ def smart_rewrite(text: str) -> str:
 
 # ---------- Core Grammar Correction ----------
 
+# Rule tables are built once at import instead of on every request.
+# Keys are matched as whole words, case-insensitively. " bro" keeps its
+# leading space so the filler is removed together with it.
+PRO_REPLACEMENTS = {
+    " bro": "",
+    "gonna": "going to",
+    "wanna": "want to",
+    "pls": "please",
+    "don't": "do not",
+    "can't": "cannot",
+    "ok": "okay",
+}
+_PRO_RE = compile_word_alternation(PRO_REPLACEMENTS, re.IGNORECASE)
+
+
+def _pro_replacement(match: "re.Match") -> str:
+    word = match.group(0)
+    right = PRO_REPLACEMENTS[word.lower()]
+    # "Don't" after a full stop becomes "Do not" ("OK" stays lowercase)
+    if right and word[0].isupper() and word[1:2].islower():
+        return right[0].upper() + right[1:]
+    return right
+
+
+def _mode_professional(text: str) -> str:
+    # A regex rather than str.replace so rules only hit whole words in any case
+    return _PRO_RE.sub(_pro_replacement, text)
+
+
+def _mode_casual(text: str) -> str:
+    return text.replace(" sir", " bro")
+
+
+# "grammar" and "fluent" modes have no extra rules
+MODE_HANDLERS = {
+    "professional": _mode_professional,
+    "casual": _mode_casual,
+}
+
+# Inputs shorter than this skip LanguageTool: the round-trip costs far more
+# than anything it could fix in one or two characters.
+MIN_CHECK_LENGTH = 3
+
+
+@text_cache(maxsize=1024)
+def apply_language_tool(text: str) -> str:
+    """
+    Run LanguageTool on the text and apply its suggestions.
+    The check is the slowest step, so results are cached by exact text.
+    """
+    matches = get_language_tool().check(text)
+    return language_tool_python.utils.correct(text, matches)
+
+
 def simple_correct(text: str, mode: str = "grammar"):
+    # Only the LanguageTool step is cached; the rest is cheap string work
     updated = text.strip()
     if not updated:
         return "", "No text provided."
 
     # 1) Grammar + spelling correction using LanguageTool
-    matches = tool.check(updated)
-    updated = language_tool_python.utils.correct(updated, matches)
-
-    # 2) Capitalize first letter of the whole text
-    updated = updated.strip()
-    if updated:
-        updated = updated[0].upper() + updated[1:]
-
-    # 3) Ensure ending punctuation
-    if updated and updated[-1] not in ".!?":
-        updated += "."
-
-    # 4) Simple tone changes (light rules)
-    if mode == "professional":
-        pro_replacements = {
-            " bro": "",
-            " gonna": " going to",
-            " wanna": " want to",
-            " pls": " please",
-            " don't": " do not",
-            " can't": " cannot",
-            " ok ": " okay ",
-        }
-        for wrong, right in pro_replacements.items():
-            updated = updated.replace(wrong, right)
-
-    elif mode == "casual":
-        updated = updated.replace(" sir", " bro")
-
-    summary = f"Grammar and spelling corrected using LanguageTool with {mode} style."
+    # Skip it for tiny inputs and for ones with no letters ("123", "?!")
+    if len(updated) < MIN_CHECK_LENGTH:
+        skipped = "Text too short for grammar check"
+    elif not any(c.isalpha() for c in updated):
+        skipped = "No words to check for grammar"
+    else:
+        skipped = None
+        updated = apply_language_tool(updated)
+
+    # 2) Simple tone changes (light rules), before capitalizing so a
+    # rewritten first word ("OK" -> "okay") still starts the sentence
+    handler = MODE_HANDLERS.get(mode)
+    if handler:
+        updated = handler(updated)
+
+    # 3) Capitalize first letter + 4) ensure ending punctuation
+    updated = finalize_text(updated)
+
+    if skipped:
+        summary = f"{skipped}; applied {mode} style cleanup."
+    else:
+        summary = f"Grammar and spelling corrected using LanguageTool with {mode} style."
     return updated, summary
 
 
 # ---------- Tone Rewriter (rule-based) ----------
 
+TONE_FRIENDLY_GREETINGS = ("hi", "hello", "hey")
+TONE_FRIENDLY_PREFIX = "Hi, "
+TONE_CARING_PREFIX = "I understand how you feel. "
+TONE_CARING_SUFFIX = " I am here for you and I truly care."
+TONE_PERSUASIVE_SUFFIX = " This will really help us move forward because it makes things clearer."
+
+# Matched as whole words; " ok" also covers "ok." and " bro" covers "okay bro"
+TONE_PROFESSIONAL_REPLACEMENTS = {
+    " bro": "",
+    " dude": "",
+    " guys": " everyone",
+    "yeah": "yes",
+    " ok": " okay",
+}
+
+TONE_CONFIDENT_WEAK_PHRASES = (
+    "I think ",
+    "maybe ",
+    "probably ",
+    "I am not sure but ",
+)
+
+TONE_CALM_REPLACEMENTS = {
+    "I am tired of": "I am concerned about",
+    "I am very angry": "I am quite upset",
+    "this is unacceptable": "this is not ideal",
+    "you never": "you rarely",
+    "you always": "you often",
+}
+
+# Whole-word matching needs a regex here: a plain " ok" replace turns
+# "okay" into "okayay"
+_TONE_PROFESSIONAL_RE = compile_word_alternation(TONE_PROFESSIONAL_REPLACEMENTS)
+
+
+def _tone_friendly(text: str) -> str:
+    text = text.replace("Regards,", "Cheers,").replace("regards,", "cheers,")
+    if not text.lower().startswith(TONE_FRIENDLY_GREETINGS):
+        text = TONE_FRIENDLY_PREFIX + text
+    return text
+
+
+def _tone_professional(text: str) -> str:
+    return _TONE_PROFESSIONAL_RE.sub(
+        lambda m: TONE_PROFESSIONAL_REPLACEMENTS[m.group(0)], text
+    )
+
+
+def _tone_confident(text: str) -> str:
+    for weak in TONE_CONFIDENT_WEAK_PHRASES:
+        text = text.replace(weak, "")
+    text = text.replace("I will try to", "I will")
+    return text.replace("I will try", "I will")
+
+
+def _tone_calm(text: str) -> str:
+    for strong, calm in TONE_CALM_REPLACEMENTS.items():
+        text = text.replace(strong, calm)
+    return text
+
+
+def _tone_caring(text: str) -> str:
+    lowered = text.lower()
+    if not lowered.startswith("i understand"):
+        text = TONE_CARING_PREFIX + text
+    if "sorry" not in lowered:
+        text += TONE_CARING_SUFFIX
+    return text
+
+
+def _tone_persuasive(text: str) -> str:
+    if "because" not in text.lower():
+        text += TONE_PERSUASIVE_SUFFIX
+    return text
+
+
+TONE_HANDLERS = {
+    "friendly": _tone_friendly,
+    "professional": _tone_professional,
+    "confident": _tone_confident,
+    "calm": _tone_calm,
+    "caring": _tone_caring,
+    "persuasive": _tone_persuasive,
+}
+
+
+@text_cache(maxsize=512)
 def apply_tone(text: str, tone: str) -> str:
-    t = tone.lower()
-    result = normalize_spaces(text)
-
-    if t == "friendly":
-        result = result.replace("Regards,", "Cheers,")
-        result = result.replace("regards,", "cheers,")
-        if not result.lower().startswith(("hi", "hello", "hey")):
-            result = "Hi, " + result
-    elif t == "professional":
-        replacements = {
-            " bro": "",
-            " dude": "",
-            " guys": " everyone",
-            "yeah": "yes",
-            " ok": " okay",
-            " ok.": " okay.",
-            " okay bro": " okay",
-        }
-        for wrong, right in replacements.items():
-            result = result.replace(wrong, right)
-    elif t == "confident":
-        weak_phrases = [
-            "I think ",
-            "maybe ",
-            "probably ",
-            "I am not sure but ",
-        ]
-        for w in weak_phrases:
-            result = result.replace(w, "")
-        result = result.replace("I will try to", "I will")
-        result = result.replace("I will try", "I will")
-    elif t == "calm":
-        strong_to_calm = {
-            "I am tired of": "I am concerned about",
-            "I am very angry": "I am quite upset",
-            "this is unacceptable": "this is not ideal",
-            "you never": "you rarely",
-            "you always": "you often",
-        }
-        for k, v in strong_to_calm.items():
-            result = result.replace(k, v)
-    elif t == "caring":
-        if not result.lower().startswith(("i understand", "I understand")):
-            result = "I understand how you feel. " + result
-        if "sorry" not in result.lower():
-            result += " I am here for you and I truly care."
-    elif t == "persuasive":
-        if "because" not in result.lower():
-            result += " This will really help us move forward because it makes things clearer."
-    return result
+    # tone is one of ToneRequest's Literal values, so every key is present
+    return TONE_HANDLERS[tone](normalize_spaces(text))
 
 
 # ---------- /correct ----------
 
-@app.post("/correct")
-def correct_text(body: TextRequest):
-    text = body.text.strip()
+# Corrections are deterministic per (text, mode), so /correct tags each
+# response with an ETag. Browsers never cache POST responses: a client that
+# wants to skip repeat work must keep its own response body per ETag and send
+# that tag back in If-None-Match.
+def correction_etag(text: str, mode: str) -> str:
+    return '"%s"' % hashlib.sha1(f"{text}|{mode}".encode()).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in tags or f"W/{etag}" in tags
+
+
+@app.post("/correct", response_model=CorrectionResponse)
+@limiter.shared_limit(CORRECT_RATE_LIMIT, scope=CORRECT_LIMIT_SCOPE)
+async def correct_text(request: Request, response: Response, body: TextRequest):
+    text = body.text
+
+    etag = correction_etag(text, body.mode)
+    # RFC 9110: a matching If-None-Match on a POST is answered with 412, not
+    # 304. The caller already holds the body for this tag, so no work is done.
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=412, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     if not text:
         return {
             "correctedText": "",
             "changesSummary": "No text provided.",
         }
 
-    corrected, summary = simple_correct(text, body.mode or "grammar")
+    # LanguageTool is a blocking call, keep it off the event loop
+    corrected, summary = await run_coalesced(simple_correct, text, body.mode)
 
     return {
         "correctedText": corrected,
@@ -288,11 +653,41 @@ def correct_text(body: TextRequest):
     }
 
 
+# ---------- /correct/bulk ----------
+
+@app.post("/correct/bulk", response_model=BulkCorrectionResponse)
+async def correct_texts(request: Request, body: BulkTextRequest):
+    """
+    Correct many texts in one request. Checks run concurrently on the
+    LanguageTool pool; repeated texts hit the cache or share one check.
+    """
+    if not hit_correct_limit(request, len(body.texts)):
+        return JSONResponse(
+            {"error": f"Rate limit exceeded: {CORRECT_LIMIT}"},
+            status_code=429,
+        )
+
+    async def correct_one(text: str):
+        if not text:
+            return "", "No text provided."
+        return await run_coalesced(simple_correct, text, body.mode)
+
+    results = await asyncio.gather(*(correct_one(text) for text in body.texts))
+
+    return {
+        "results": [
+            {"correctedText": corrected, "changesSummary": summary}
+            for corrected, summary in results
+        ],
+    }
+
+
 # ---------- /polish-ai (Smart Rewrite v2) ----------
 
-@app.post("/polish-ai")
-def polish_ai(body: AIRequest):
-    base = body.text.strip()
+@app.post("/polish-ai", response_model=CorrectionResponse)
+@limiter.limit(POLISH_RATE_LIMIT)
+async def polish_ai(request: Request, body: AIRequest):
+    base = body.text
     if not base:
         return {
             "correctedText": "",
@@ -300,7 +695,7 @@ def polish_ai(body: AIRequest):
         }
 
     # Step 1: fix grammar + spelling
-    corrected, _ = simple_correct(base, "grammar")
+    corrected, _ = await run_coalesced(simple_correct, base, "grammar")
 
     # Step 2: Smart Rewrite v2 to improve fluency
     fluent = smart_rewrite(corrected)
@@ -313,9 +708,9 @@ def polish_ai(body: AIRequest):
 
 # ---------- /rewrite-tone (uses Smart Rewrite too) ----------
 
-@app.post("/rewrite-tone")
-def rewrite_tone(body: ToneRequest):
-    base = body.text.strip()
+@app.post("/rewrite-tone", response_model=CorrectionResponse)
+async def rewrite_tone(body: ToneRequest):
+    base = body.text
     if not base:
         return {
             "correctedText": "",
@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+class FakeLanguageTool:
+    """Stands in for the LanguageTool JVM: records checks, suggests nothing."""
+
+    def __init__(self):
+        self.checked = []
+
+    def check(self, text):
+        self.checked.append(text)
+        return []
+
+
+@pytest.fixture(autouse=True)
+def fake_tool(monkeypatch):
+    tool = FakeLanguageTool()
+    monkeypatch.setattr(main, "get_language_tool", lambda: tool)
+    main.apply_language_tool.cache_clear()
+    main.smart_rewrite.cache_clear()
+    main.apply_tone.cache_clear()
+    main.limiter.reset()
+    return tool
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def test_warmup_failure_is_logged(monkeypatch, caplog):
+    def broken_tool():
+        raise RuntimeError("no java")
+
+    async def wait_for_warmup():
+        await asyncio.wait([main.app.state.tool_warmup])
+
+    monkeypatch.setattr(main, "get_language_tool", broken_tool)
+    with caplog.at_level(logging.ERROR, logger="main"):
+        with TestClient(main.app) as started:
+            started.portal.call(wait_for_warmup)
+            assert started.get("/").status_code == 200
+    assert "LanguageTool warm-up failed" in caplog.text
+
+
+def test_warmup_runs_a_check(fake_tool):
+    async def wait_for_warmup():
+        await asyncio.wait([main.app.state.tool_warmup])
+
+    with TestClient(main.app) as started:
+        started.portal.call(wait_for_warmup)
+    assert fake_tool.checked == ["Hello world."]
+
+
+def test_app_serves_after_restart():
+    for _ in range(2):
+        with TestClient(main.app) as started:
+            res = started.post("/correct", json={"text": "hello there"})
+            assert res.json()["correctedText"] == "Hello there."
+
+
+def test_correct(fake_tool):
+    res = client.post("/correct", json={"text": "  hello there ", "mode": "grammar"})
+    assert res.status_code == 200
+    assert res.json()["correctedText"] == "Hello there."
+    assert fake_tool.checked == ["hello there"]
+
+
+def test_run_coalesced_shares_one_call():
+    calls = []
+    release = threading.Event()
+
+    def slow_double(x):
+        calls.append(x)
+        release.wait(5)
+        return x * 2
+
+    async def run_all():
+        results = asyncio.gather(*(main.run_coalesced(slow_double, 3) for _ in range(5)))
+        await asyncio.sleep(0.01)
+        release.set()
+        return await results
+
+    assert asyncio.run(run_all()) == [6] * 5
+    assert calls == [3]
+
+
+def test_polish_ai():
+    res = client.post("/polish-ai", json={"text": "so i will maybe try to go. and  go home"})
+    assert res.status_code == 200
+    assert res.json()["correctedText"] == "As a result, I will go. go home."
+
+
+def test_rewrite_tone():
+    res = client.post("/rewrite-tone", json={"text": "  yeah ok guys ", "tone": "professional"})
+    assert res.status_code == 200
+    assert res.json()["correctedText"] == "yes okay everyone"
+    assert client.post("/rewrite-tone", json={"text": "hi", "tone": "angry"}).status_code == 422
+
+
+def test_polish_ai_rate_limit():
+    for _ in range(60):
+        assert client.post("/polish-ai", json={"text": "hi"}).status_code == 200
+    assert client.post("/polish-ai", json={"text": "hi"}).status_code == 429
+
+
+def test_correct_validates_mode():
+    res = client.post("/correct", json={"text": "hi", "mode": "fluent"})
+    assert res.status_code == 200
+    assert client.post("/correct", json={"text": "hi", "mode": "pirate"}).status_code == 422
+    assert client.post("/correct", json={"text": "hi", "mode": None}).status_code == 422
+
+
+def test_correct_bulk(fake_tool):
+    res = client.post(
+        "/correct/bulk", json={"texts": ["one two", "", "one two"], "mode": "grammar"}
+    )
+    assert res.status_code == 200
+    results = res.json()["results"]
+    assert [r["correctedText"] for r in results] == ["One two.", "", "One two."]
+    assert results[1]["changesSummary"] == "No text provided."
+    assert fake_tool.checked == ["one two"]
+
+
+def test_correct_bulk_caps_number_of_texts():
+    texts = ["hi"] * (main.BULK_MAX_TEXTS + 1)
+    assert client.post("/correct/bulk", json={"texts": texts}).status_code == 422
+
+
+def test_correct_bulk_shares_the_correct_budget():
+    # 120 corrections per minute, shared by /correct and every bulk text
+    assert client.post("/correct", json={"text": "hi"}).status_code == 200
+    assert client.post("/correct/bulk", json={"texts": ["hi"] * 100}).status_code == 200
+    assert client.post("/correct/bulk", json={"texts": ["hi"] * 19}).status_code == 200
+    assert client.post("/correct", json={"text": "hi"}).status_code == 429
+    assert client.post("/correct/bulk", json={"texts": ["hi"]}).status_code == 429
+
+
+def test_correct_etag_precondition(fake_tool):
+    res = client.post("/correct", json={"text": "hello there"})
+    etag = res.headers["etag"]
+
+    res = client.post(
+        "/correct", json={"text": "hello there"}, headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 412
+    assert res.headers["etag"] == etag
+    assert fake_tool.checked == ["hello there"]
+
+
+def test_correct_rejects_long_text():
+    long_text = "a" * (main.MAX_TEXT_LENGTH + 1)
+    assert client.post("/correct", json={"text": long_text}).status_code == 422
+    assert client.post("/polish-ai", json={"text": long_text}).status_code == 422
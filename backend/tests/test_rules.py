@@ -0,0 +1,147 @@
+import random
+import re
+
+import main
+
+
+def legacy_split_sentences(text):
+    # The original re.split based splitter, kept as a reference
+    parts = re.split(r"([.!?])", text)
+    sentences = []
+    current = ""
+    for part in parts:
+        if not part:
+            continue
+        if part in ".!?":
+            current += part
+            sentences.append(current.strip())
+            current = ""
+        else:
+            current += part
+    if current.strip():
+        sentences.append(current.strip())
+    return sentences
+
+
+def test_split_sentences_matches_legacy_splitter():
+    rng = random.Random(0)
+    alphabet = "ab .!?\n"
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 15)))
+        assert main.split_sentences(text) == legacy_split_sentences(text)
+
+
+def test_professional_tone_matches_whole_words():
+    assert main.apply_tone("That is okay with me", "professional") == "That is okay with me"
+    assert main.apply_tone("yeah ok, okay bro guys.", "professional") == "yes okay, okay everyone."
+    assert main.apply_tone("My brother, dude", "professional") == "My brother,"
+
+
+def test_simple_correct_skips_languagetool_for_short_text(fake_tool):
+    assert main.simple_correct("k") == (
+        "K.",
+        "Text too short for grammar check; applied grammar style cleanup.",
+    )
+    assert fake_tool.checked == []
+
+
+def test_smart_rewrite_connectors():
+    assert main.smart_rewrite("But later I left. so I stayed. And then. Butter is fine.") == (
+        "However, later I left. As a result, I stayed. then. Butter is fine."
+    )
+    assert main.smart_rewrite("Later.") == "Later."
+
+
+def test_smart_rewrite_phrase_rules():
+    assert main.smart_rewrite("I think yes.") == "yes."
+    assert main.smart_rewrite("i will maybe try to go. It is very very very good.") == (
+        "I will go. It is very very good."
+    )
+    assert main.smart_rewrite("but i  will go. ok. ok.") == "However, I will go. ok."
+
+
+def per_sentence_rewrite(text):
+    # Phrase rules applied sentence by sentence, as smart_rewrite used to
+    improved = []
+    for sent in main.split_sentences(main.normalize_spaces(text)):
+        new_s = main.rewrite_connector(main.rewrite_phrases(sent))
+        if not improved or new_s != improved[-1]:
+            improved.append(new_s)
+    return " ".join(improved)
+
+
+def test_paragraph_rewrite_matches_per_sentence_rewrite():
+    rng = random.Random(2)
+    words = ["i", "I think", "maybe", "will try to", "very", "but", "so", "and", "ok", ".", "!", "?"]
+    for _ in range(2000):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        assert main.smart_rewrite(text) == per_sentence_rewrite(text)
+
+
+def test_normalize_spaces_matches_split_join():
+    rng = random.Random(1)
+    alphabet = "ab \t\n\r\x0b\x1c\x00\xa0."
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+        assert main.normalize_spaces(text) == " ".join(text.split())
+
+
+def test_text_cache_skips_long_texts():
+    calls = []
+
+    @main.text_cache(maxsize=8)
+    def shout(text):
+        calls.append(text)
+        return text.upper()
+
+    long_text = "a" * (main.CACHE_MAX_TEXT_LENGTH + 1)
+    for text in ("abc", "abc", long_text, long_text):
+        shout(text)
+    assert calls == ["abc", long_text, long_text]
+    assert shout.cache_info().currsize == 1
+
+
+def test_professional_mode_matches_whole_words():
+    assert main.simple_correct("Don't go bro, ok", "professional")[0] == "Do not go, okay."
+    assert main.simple_correct("My brother is OK", "professional")[0] == "My brother is okay."
+    assert main.simple_correct("I can't, I'm gonna. Pls", "professional")[0] == (
+        "I cannot, I'm going to. Please."
+    )
+
+
+def test_professional_mode_keeps_first_word_capitalized():
+    assert main.simple_correct("OK, thanks", "professional")[0] == "Okay, thanks."
+    assert main.simple_correct("PLS send it", "professional")[0] == "Please send it."
+    assert main.simple_correct("DON'T go", "professional")[0] == "Do not go."
+
+
+def test_simple_correct_skips_languagetool_without_letters(fake_tool):
+    assert main.simple_correct("1234 5678") == (
+        "1234 5678.",
+        "No words to check for grammar; applied grammar style cleanup.",
+    )
+    assert fake_tool.checked == []
+
+
+def test_finalize_text():
+    assert main.finalize_text("hello") == "Hello."
+    assert main.finalize_text("Done!") == "Done!"
+    assert main.finalize_text("") == ""
+
+
+def test_tone_handlers():
+    assert main.apply_tone("Thanks. regards, Sam", "friendly") == "Hi, Thanks. cheers, Sam"
+    assert main.apply_tone("Hey there", "friendly") == "Hey there"
+    assert main.apply_tone("I think I will try to finish", "confident") == "I will finish"
+    assert main.apply_tone("maybe I will try", "confident") == "I will"
+    assert main.apply_tone("you always say this is unacceptable", "calm") == (
+        "you often say this is not ideal"
+    )
+    assert main.apply_tone("That hurts", "caring") == (
+        "I understand how you feel. That hurts I am here for you and I truly care."
+    )
+    assert main.apply_tone("I understand, sorry", "caring") == "I understand, sorry"
+    assert main.apply_tone("Do it", "persuasive") == (
+        "Do it This will really help us move forward because it makes things clearer."
+    )
+    assert main.apply_tone("Do it because", "persuasive") == "Do it because"
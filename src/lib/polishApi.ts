@@ -1,7 +1,7 @@
 // src/lib/polishApi.ts
 // Helpers to talk to FastAPI backend
 
-export type Mode = "grammar" | "professional" | "casual";
+export type Mode = "grammar" | "professional" | "casual" | "fluent";
 export type CorrectionMode = Mode;
 
 export type ToneMode =